@@ -1,23 +1,73 @@
 import re
 import random
-from typing import List, Tuple, Union, Dict, Any
-from collections import Counter
+import array
+from typing import List, Tuple, Union, Dict, Optional
+from collections import Counter, deque
+from operator import itemgetter
+import heapq
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
+import platform
+import importlib.machinery
+
+import _counting_kernels
+
+if platform.python_implementation() == "PyPy":
+    np = None  # NumPy runs through PyPy's slow cpyext layer; the JIT does better without it
+else:
+    try:
+        import numpy as np
+    except ImportError:  # NumPy is optional; counting falls back to plain lists
+        np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; character counts fall back to np.bincount
+    njit = None
+
+_WORD_RE = re.compile(r'\w+')
+_INT_RE = re.compile(r'-?\d+')
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+_FLOAT64_EXACT = 2**53  # np.arange sizes its output in float64, exact only below this span
+# The pure-Python kernels only pay off once compiled to a C extension by mypyc
+_KERNELS_COMPILED = _counting_kernels.__file__.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _hist_u8(buf):
+        """Histogram a uint8 buffer into 256 int64 bins."""
+        h = np.zeros(256, np.int64)
+        for b in buf:
+            h[b] += 1
+        return h
+else:
+    _hist_u8 = None
 
 class CountingAI:
     """AI-powered counting assistant with multiple counting modes."""
     
+    HISTORY_LIMIT = 500
+    
     def __init__(self):
-        self.history = []
+        self.history = deque(maxlen=self.HISTORY_LIMIT)
+        self.history_total = 0  # Records added since the last clear, including evicted ones
+        self._snap = ()  # Immutable copy of history, refreshed on every mutation
+        self._lock = threading.Lock()  # Counts may run on a worker thread
         self.mode = "basic"
         self.custom_items = []
         self.last_result = None
     
-    def basic_count(self, start: int, end: int, step: int = 1) -> List[int]:
-        """Perform basic counting with specified parameters."""
+    def basic_count(self, start: int, end: int, step: int = 1) -> Union[List[int], range, array.array, "np.ndarray"]:
+        """Perform basic counting with specified parameters.
+
+        Unit steps return a lazy range, which needs no allocation and has no
+        int32/int64 ceiling, so they are never routed through a compiled
+        array kernel. Other steps return a contiguous int64 NumPy array when
+        NumPy is installed and the span is below 2**53, otherwise a packed
+        array.array. Bounds outside int64 fall back to a list.
+        """
         if step == 0:
             raise ValueError("Step cannot be zero")
         if start == end:
@@ -25,22 +75,49 @@ class CountingAI:
         if (start < end and step < 0) or (start > end and step > 0):
             return []
         
-        result = list(range(start, end + (1 if step > 0 else -1), step))
+        stop = end + (1 if step > 0 else -1)
+        # Computed arithmetically: len() overflows for ranges past sys.maxsize
+        count = (end - start) // step + 1
+        if abs(step) == 1:
+            result = range(start, stop, step)
+        elif not (_INT64_MIN <= start <= _INT64_MAX and _INT64_MIN <= stop <= _INT64_MAX):
+            # np.arange can silently wrap instead of raising, so check first
+            result = list(range(start, stop, step))
+        elif np is not None and abs(stop - start) < _FLOAT64_EXACT:
+            result = np.arange(start, stop, step, dtype=np.int64)
+        else:
+            # Wider spans would make np.arange truncate its float64-computed length
+            result = array.array('q', range(start, stop, step))
         self.last_result = result
-        self.history.append(("Basic Count", f"from {start} to {end} by {step}", result))
+        self._record("Basic Count", f"from {start} to {end} by {step}", count)
         return result
     
     def count_occurrences(self, text: str, case_sensitive: bool = False) -> Dict[str, int]:
         """Count occurrences of characters, words, or numbers in text."""
         if not case_sensitive:
+            # str.lower already has an ASCII fast path; a bytes.translate
+            # table round-trip measured slower, so it is not used here
             text = text.lower()
         
         # Extract words and numbers
-        words = re.findall(r'\b\w+\b', text)
+        words = text.split()
+        if not (text.isascii() and ''.join(words).isalnum()):
+            # Punctuation or non-ASCII text: whitespace alone does not delimit words
+            words = _WORD_RE.findall(text)
         # Count everything (including punctuation as individual items)
-        all_chars = list(text.replace(' ', ''))  # Remove spaces for char count
-        
-        char_count = Counter(all_chars)
+        if np is not None and text.isascii():
+            buf = np.frombuffer(text.encode('ascii'), np.uint8)
+            hist = _hist_u8(buf) if _hist_u8 is not None else np.bincount(buf, minlength=128)
+            hist[0x20] = 0  # Remove spaces for char count
+            char_count = {chr(i): int(hist[i]) for i in np.flatnonzero(hist)}
+        elif _KERNELS_COMPILED and text.isascii():
+            hist = _counting_kernels.ascii_histogram(text.encode('ascii'))
+            hist[0x20] = 0  # Remove spaces for char count
+            char_count = {chr(i): n for i, n in enumerate(hist) if n}
+        else:
+            char_count = Counter(text.replace(' ', ''))  # Remove spaces for char count
+        # Counter's C counting loop outperforms a sort-based np.unique here,
+        # even for object or fixed-width string arrays of a million tokens
         word_count = Counter(words)
         
         result = {
@@ -49,7 +126,8 @@ class CountingAI:
         }
         
         self.last_result = result
-        self.history.append(("Count Occurrences", f"Text: '{text[:20]}...'", result))
+        self._record("Count Occurrences", f"Text: '{text[:20]}...'",
+                     len(result["characters"]) + len(result["words"]))
         return result
     
     def custom_count(self, items: List[str]) -> Dict[str, int]:
@@ -57,21 +135,42 @@ class CountingAI:
         count = Counter(items)
         result = dict(count)
         self.last_result = result
-        self.history.append(("Custom Count", f"{len(items)} items", result))
+        self._record("Custom Count", f"{len(items)} items", len(result))
         return result
     
-    def get_history(self) -> List[Tuple[str, str, Any]]:
-        """Return the history of counting operations."""
-        return self.history
+    def _record(self, mode: str, description: str, size: Optional[int]):
+        """Append an operation to the bounded history.
+
+        Only the result size is kept; the full payload lives in last_result.
+        """
+        with self._lock:
+            self.history.append((mode, description, size))
+            self.history_total += 1
+            self._snap = tuple(self.history)
+    
+    def get_history(self) -> Tuple[Tuple[str, str, Optional[int]], ...]:
+        """Return the most recent counting operations (at most HISTORY_LIMIT)."""
+        return self._snap
+    
+    def history_state(self) -> Tuple[Tuple[Tuple[str, str, Optional[int]], ...], int]:
+        """Return the history snapshot and history_total as a consistent pair."""
+        with self._lock:
+            return self._snap, self.history_total
     
     def clear_history(self):
         """Clear the operation history."""
-        self.history = []
+        with self._lock:
+            self.history.clear()
+            self.history_total = 0
+            self._snap = ()
         self.last_result = None
 
 class CountingGUI:
     """Graphical User Interface for the Counting AI."""
     
+    DISPLAY_LIMIT = 1000
+    WORD_PAGE_ROWS = 200
+    
     def __init__(self, root):
         self.root = root
         self.root.title("AI Counting Assistant")
@@ -79,6 +178,12 @@ class CountingGUI:
         self.root.configure(bg="#f0f0f0")
         
         self.ai = CountingAI()
+        self._history_seen = 0
+        self._history_pending = False
+        self._word_counts = None  # Word counts still being paged into the result text
+        self._sorted_words = None  # Words ordered so far for paging
+        self._words_rendered = 0
+        self._more_words_pending = False
         self.setup_ui()
         self.update_history()
     
@@ -165,6 +270,7 @@ class CountingGUI:
         self.result_text = scrolledtext.ScrolledText(result_frame, width=80, height=10, 
                                                     font=("Consolas", 10))
         self.result_text.pack(fill=tk.BOTH, expand=True)
+        self.result_text.configure(yscrollcommand=self._on_result_scroll)
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -207,16 +313,17 @@ class CountingGUI:
             self.custom_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
     
     def perform_count(self):
-        """Perform the counting operation based on the current mode."""
+        """Read the inputs for the current mode and start counting in the background."""
         mode = self.mode_var.get()
         
         try:
             if mode == "basic":
-                start = int(self.start_entry.get())
-                end = int(self.end_entry.get())
-                step = int(self.step_entry.get())
-                result = self.ai.basic_count(start, end, step)
-                self.display_result("Basic Count", f"Counting from {start} to {end} by {step}:\n{result}")
+                values = [self.start_entry.get().strip(), self.end_entry.get().strip(),
+                          self.step_entry.get().strip()]
+                if not all(_INT_RE.fullmatch(value) for value in values):
+                    raise ValueError("start, end and step must be integers")
+                start, end, step = map(int, values)
+                payload = (start, end, step)
                 
             elif mode == "occurrences":
                 text = self.text_entry.get()
@@ -224,8 +331,7 @@ class CountingGUI:
                     messagebox.showwarning("Input Error", "Please enter text to analyze.")
                     return
                 case_sensitive = self.case_var.get()
-                result = self.ai.count_occurrences(text, case_sensitive)
-                self.display_occurrences_result(text, result)
+                payload = (text, case_sensitive)
                 
             elif mode == "custom":
                 items_str = self.custom_entry.get()
@@ -236,52 +342,151 @@ class CountingGUI:
                 if not items:
                     messagebox.showwarning("Input Error", "Please enter valid items separated by commas.")
                     return
-                result = self.ai.custom_count(items)
-                self.display_custom_result(items, result)
+                payload = (items,)
             
-            # Update history
-            self.update_history()
+            else:
+                return
             
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid input: {str(e)}")
+            return
+        
+        self.count_button.configure(state="disabled")
+        threading.Thread(target=self._bg_count, args=(mode, payload), daemon=True).start()
+    
+    def _bg_count(self, mode: str, payload: Tuple):
+        """Run the counting operation on a worker thread."""
+        method = {
+            "basic": self.ai.basic_count,
+            "occurrences": self.ai.count_occurrences,
+            "custom": self.ai.custom_count,
+        }[mode]
+        try:
+            result = method(*payload)
         except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
+            self.root.after(0, self._fail_count, e)
+        else:
+            self.root.after(0, self._finish_count, mode, payload, result)
+    
+    def _finish_count(self, mode: str, payload: Tuple, result):
+        """Display a finished count on the Tk thread."""
+        try:
+            if mode == "basic":
+                start, end, step = payload
+                self.display_result("Basic Count", f"Counting from {start} to {end} by {step}:\n{self.format_sequence(result)}")
+            elif mode == "occurrences":
+                self.display_occurrences_result(payload[0], result)
+            elif mode == "custom":
+                self.display_custom_result(payload[0], result)
+            
+            # Update history
+            self.schedule_history_update()
+        finally:
+            self.count_button.configure(state="normal")
+    
+    def _fail_count(self, error: Exception):
+        """Report an error raised by the worker thread."""
+        self.count_button.configure(state="normal")
+        if isinstance(error, ValueError):
+            messagebox.showerror("Input Error", f"Invalid input: {str(error)}")
+        else:
+            messagebox.showerror("Error", f"An unexpected error occurred: {str(error)}")
+    
+    def format_sequence(self, result) -> str:
+        """Format a basic count result without materializing large sequences."""
+        if np is not None and isinstance(result, np.ndarray):
+            return np.array2string(result, threshold=100, separator=", ")
+        # Slice before measuring, since len() overflows for huge ranges
+        head = list(result[:self.DISPLAY_LIMIT + 1])
+        if len(head) > self.DISPLAY_LIMIT:
+            return f"{head[:self.DISPLAY_LIMIT]}..."
+        return str(head)
     
     def display_result(self, title: str, result: str):
         """Display a simple result in the result text area."""
+        self._word_counts = None
         self.result_text.delete(1.0, tk.END)
         self.result_text.insert(tk.END, result)
     
     def display_occurrences_result(self, text: str, result: Dict):
-        """Display the occurrences counting result."""
+        """Display the occurrences counting result, most frequent first.
+
+        Only the first page of words is rendered; later pages are appended as
+        the result text is scrolled to the bottom.
+        """
+        sorted_chars = Counter(result["characters"]).most_common()
+        # Heap-select the first page instead of sorting every word
+        self._sorted_words = heapq.nlargest(self.WORD_PAGE_ROWS, result["words"].items(),
+                                            key=itemgetter(1))
+        self._word_counts = result["words"]
+        self._words_rendered = min(len(self._sorted_words), self.WORD_PAGE_ROWS)
         self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, f"Text analyzed: \"{text}\"\n\n")
-        self.result_text.insert(tk.END, "Character counts:\n")
-        for char, count in sorted(result["characters"].items()):
-            self.result_text.insert(tk.END, f"  '{char}': {count}\n")
-        
-        self.result_text.insert(tk.END, "\nWord counts:\n")
-        for word, count in sorted(result["words"].items()):
-            self.result_text.insert(tk.END, f"  '{word}': {count}\n")
+        # Build the text once so Tk gets a single insert instead of one per row
+        char_lines = [f"  '{char}': {count}\n" for char, count in sorted_chars]
+        word_lines = [f"  '{word}': {count}\n" for word, count in self._sorted_words[:self._words_rendered]]
+        self.result_text.insert(tk.END, f"Text analyzed: \"{text}\"\n\n"
+                                "Character counts:\n" + "".join(char_lines) +
+                                "\nWord counts:\n" + "".join(word_lines))
+    
+    def _on_result_scroll(self, first, last):
+        """Forward scroll updates and request more words at the bottom."""
+        self.result_text.vbar.set(first, last)
+        if (float(last) >= 1.0 and not self._more_words_pending
+                and self._word_counts is not None
+                and self._words_rendered < len(self._word_counts)):
+            self._more_words_pending = True
+            self.root.after_idle(self._render_more_words)
+    
+    def _render_more_words(self):
+        """Append the next page of word counts to the result text."""
+        self._more_words_pending = False
+        if self._word_counts is None:
+            return
+        end = self._words_rendered + self.WORD_PAGE_ROWS
+        if end > len(self._sorted_words) and len(self._sorted_words) < len(self._word_counts):
+            # Past the heap-selected page; nlargest is stable, so this order matches it
+            self._sorted_words = sorted(self._word_counts.items(), key=itemgetter(1), reverse=True)
+        rows = self._sorted_words[self._words_rendered:end]
+        self._words_rendered += len(rows)
+        self.result_text.insert(tk.END, "".join(f"  '{word}': {count}\n" for word, count in rows))
     
     def display_custom_result(self, items: List[str], result: Dict[str, int]):
         """Display the custom list counting result."""
+        self._word_counts = None
         self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, f"Items analyzed: {items}\n\n")
-        self.result_text.insert(tk.END, "Count results:\n")
-        for item, count in sorted(result.items()):
-            self.result_text.insert(tk.END, f"  '{item}': {count}\n")
+        lines = [f"  '{item}': {count}\n" for item, count in sorted(result.items())]
+        self.result_text.insert(tk.END, f"Items analyzed: {items}\n\n"
+                                "Count results:\n" + "".join(lines))
+    
+    def schedule_history_update(self):
+        """Coalesce history refreshes into a single idle callback."""
+        if not self._history_pending:
+            self._history_pending = True
+            self.root.after_idle(self.update_history)
     
     def update_history(self):
-        """Update the history listbox."""
-        self.history_listbox.delete(0, tk.END)
-        for i, (mode, description, _) in enumerate(self.ai.get_history()):
+        """Append records added since the last update to the history listbox."""
+        self._history_pending = False
+        history, total = self.ai.history_state()
+        size = len(history)
+        new = min(total - self._history_seen, size)
+        rows = [(i, history[i - total]) for i in range(total - new, total)]
+        
+        for i, (mode, description, _) in rows:
             self.history_listbox.insert(tk.END, f"{i+1}. {mode} - {description}")
+        
+        # Drop rows that have been evicted from the bounded history
+        overflow = self.history_listbox.size() - size
+        if overflow > 0:
+            self.history_listbox.delete(0, overflow - 1)
+        self._history_seen = total
     
     def clear_history(self):
         """Clear the operation history."""
         self.ai.clear_history()
-        self.update_history()
+        self.history_listbox.delete(0, tk.END)
+        self._history_seen = 0
+        self._sorted_words = self._word_counts = None
         self.result_text.delete(1.0, tk.END)
 
 def main():
@@ -0,0 +1,17 @@
+"""Counting kernels that can be AOT-compiled with mypyc.
+
+Interpreted, these loops are slower than the C-backed Counter path, so
+Main.py only dispatches to them once they are compiled:
+
+    pip install mypy
+    mypyc _counting_kernels.py
+"""
+from typing import List
+
+
+def ascii_histogram(data: bytes) -> List[int]:
+    """Count each byte value of an ASCII buffer into 128 bins."""
+    hist = [0] * 128
+    for b in data:
+        hist[b] += 1
+    return hist
@@ -0,0 +1,16 @@
+#!/bin/sh
+# Run the AI Counting Assistant under PyPy3, whose JIT speeds up the
+# Counter/regex counting paths without source changes.
+# Tk support comes from the distribution's PyPy Tk package (e.g. pypy3-tk
+# on Debian/Ubuntu). NumPy and Numba are skipped under PyPy.
+set -e
+
+PYPY="${PYPY:-pypy3}"
+
+if ! "$PYPY" -c "import tkinter" 2>/dev/null; then
+    echo "$PYPY cannot import tkinter; install the PyPy Tk package (e.g. pypy3-tk)." >&2
+    exit 1
+fi
+
+cd "$(dirname "$0")"
+exec "$PYPY" Main.py "$@"